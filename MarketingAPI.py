@@ -1,12 +1,14 @@
 from __future__ import annotations
-import json
-from dataclasses import dataclass
+import logging
+import orjson
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from functools import total_ordering
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
 
 # Dict used to rank the status of a marketing request. Aids with sorting.
-STATUS_ORDER = {
+STATUS_ORDER: Dict[Optional[str], int] = {
     "Not Started": 0,
     "Need Visuals": 1,
     "Drafted": 2,
@@ -14,8 +16,29 @@ STATUS_ORDER = {
     "Posted": 4,
 }
 
-@dataclass
-@total_ordering
+# Multiplier that packs (status rank, post timestamp) into one int sort key. 2**40 seconds is
+# roughly 35,000 years, so any realistic timestamp stays within a single status band.
+_STATUS_RANK_STRIDE = 1 << 40
+
+# Post date assumed for sorting when a request has none (September 1st 2024).
+_DEFAULT_POST_DATE = datetime(2024, 9, 1)
+
+
+def _parse_notion_date(date_str: str) -> datetime:
+    """
+    Parse a Notion date string into a datetime object.
+    Notion emits plain "YYYY-MM-DD" dates, which are sliced directly; anything else
+    falls back to datetime.fromisoformat.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            pass
+    return datetime.fromisoformat(date_str)
+
+
+@dataclass(slots=True)
 class MarketingRequest:
     """
     POPO class to represent a marketing request.
@@ -44,6 +67,14 @@ class MarketingRequest:
     post_date: Optional[datetime] = None
     final_post: Optional[Any] = None
     visuals: Optional[Any] = None
+    _ts: int = field(init=False, repr=False, compare=False)
+    _cached_sort_key: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The sort key only depends on fields that are fixed once parsed, so build it once
+        # here instead of on every comparison.
+        self._ts = int((self.post_date if self.post_date is not None else _DEFAULT_POST_DATE).timestamp())
+        self._cached_sort_key = self._sort_key()
 
     @classmethod
     def from_notion_page(cls, page: Dict[str, Any]) -> MarketingRequest:
@@ -59,45 +90,47 @@ class MarketingRequest:
           - "LQ>I":           → final_post (a file property)
           - "q=zv":           → visuals (a file property)
         """
-        properties = page.get("properties", {})
+        properties: Dict[str, Any] = page.get("properties", {})
+        p_get = properties.get
 
         def get_first(prop_key: str) -> Optional[str]:
             """
             Returns the first value of a property key, if it exists.
             """
-            val = properties.get(prop_key)
+            val = p_get(prop_key)
             if val and isinstance(val, list) and len(val) > 0 and isinstance(val[0], list) and len(val[0]) > 0:
                 return val[0][0]
             return None
 
-        title = get_first("title") or ""
-        event = get_first(">zXz")
-        content_type = get_first("aJ@j")
-        status = get_first("nSLy")
-        content_summary = get_first("[B|e")
+        title: str = get_first("title") or ""
+        event: Optional[str] = get_first(">zXz")
+        content_type: Optional[str] = get_first("aJ@j")
+        status: Optional[str] = get_first("nSLy")
+        content_summary: Optional[str] = get_first("[B|e")
 
         # For the post date, the Notion property "{Rrz}" is a rollup with a date object.
-        post_date = None
-        if "{Rrz" in properties:
+        post_date: Optional[datetime] = None
+        rrz: Any = p_get("{Rrz")
+        if rrz is not None:
             try:
                 # Example structure:
                 # [[ "\u2023", [ ["d", {"type": "date", "start_date": "2025-02-03"}] ] ]]
-                date_str = properties["{Rrz"][0][1][0][1].get("start_date")
+                date_str = rrz[0][1][0][1].get("start_date")
                 if date_str:
-                    post_date = datetime.fromisoformat(date_str)
+                    post_date = _parse_notion_date(date_str)
                 else:
                     post_date = None
             except Exception as e:
                 # In case of an unexpected structure or format, we leave post_date as None.
                 # Set teh post date to september 1st 2024
-                print(e)
+                logger.debug("Could not parse post date: %s", e)
                 post_date = None
         else:
             post_date = None
                 
 
         return cls(
-            id=page.get("id"),
+            id=page.get("id", ""),
             title=title,
             event=event,
             content_type=content_type,
@@ -106,34 +139,28 @@ class MarketingRequest:
             post_date=post_date,
         )
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f"<MarketingRequest id={self.id} title={self.title!r} content_type={self.content_type!r} status={self.status!r} post_date={self.post_date}>"
 
-    def _sort_key(self):
+    def _sort_key(self) -> int:
         """
-        Build the sort key as a tuple:
-          1. The first element is the numeric rank for the status.
-             If the status is not found in STATUS_ORDER, it defaults to infinity.
-          2. The second element is based on the post_date.
-             For descending order by date (i.e., newer dates first), we use the negative
-             of the timestamp. If post_date is None, we use float('inf') so that it sorts last.
+        Build the sort key as a single int equivalent to the tuple (status_rank, timestamp):
+          1. The high part is the numeric rank for the status.
+             If the status is not found in STATUS_ORDER, it ranks after every known status.
+          2. The low part is the post_date as an int POSIX timestamp (self._ts).
+             If post_date is None, September 1st 2024 is used.
+        Packing both into one int lets sorting compare plain ints rather than tuples.
         """
-        status_rank = STATUS_ORDER.get(self.status, float('inf'))
-        date_key = self.post_date if self.post_date is not None else datetime(2024, 9, 1)
+        status_rank = STATUS_ORDER.get(self.status, len(STATUS_ORDER))
 
-        return (status_rank, date_key)
+        return status_rank * _STATUS_RANK_STRIDE + self._ts
 
-    def __eq__(self, other):
+    def __eq__(self, other: object) -> bool:
         if not isinstance(other, MarketingRequest):
             return NotImplemented
-        return self._sort_key() == other._sort_key()
-
-    def __lt__(self, other):
-        if not isinstance(other, MarketingRequest):
-            return NotImplemented
-        return self._sort_key() < other._sort_key()
+        return self._cached_sort_key == other._cached_sort_key
     
-    def get_notion_link(self):
+    def get_notion_link(self) -> str:
         """
         Notion Link Format: https://www.notion.so/utmmsa2023-24/<name>-<id>
         """
@@ -159,99 +186,148 @@ class MarketingRequest:
                f"\t - 📅 Posting Date: {self.post_date.strftime('%B %d') if self.post_date else 'TBD'}\n" \
                f"\t - ⌛ Days Until Posting: {self.calculate_days_until_posting() if self.post_date else 'TBD'}\n" \
 
-    def is_this_week(self):
+    def is_this_week(self) -> bool:
         """
         Returns whether this post is to be posted on or before this week
         Precondition: This post is confirmed
         """
-        if self.status != "Confirmed":
+        if self.status != "Confirmed" or self.post_date is None:
             return False
         return self.post_date <= datetime.now()
 
 class MarketingRequestCollection:
     """
     ADT to represent a collection of MarketingRequest objects. Allows for sorting and filtering by status and content type.
+
+    Sorting is deferred: the full list and each status/content type bucket are only sorted the
+    first time they are read through this class, so a single status lookup sorts just that bucket.
+    Sorted lists are built separately and then swapped in, so concurrent readers never see a list
+    mid-sort.
     """
     def __init__(self, requests: List[MarketingRequest]):
         self.requests = requests
+        self._requests_sorted = False
+
+        # Index the requests by status and content type in one pass.
+        self._by_status: Dict[Optional[str], List[MarketingRequest]] = {}
+        self._by_type: Dict[Optional[str], List[MarketingRequest]] = {}
+        for req in requests:
+            self._by_status.setdefault(req.status, []).append(req)
+            self._by_type.setdefault(req.content_type, []).append(req)
+        self._sorted_status: Set[Optional[str]] = set()
+        self._sorted_type: Set[Optional[str]] = set()
 
     @classmethod
-    def from_record_map(cls, record_map: Dict[str, Any]) -> MarketingRequestCollection:
+    def from_record_map(cls, record_map: Any) -> MarketingRequestCollection:
         """
         Given the full Notion record map JSON (as a dict) and the marketing collection ID,
         filter out the page blocks whose parent_table is "collection" and whose parent_id
         matches the provided collection_id. Each such block is interpreted as a marketing request.
+
+        record_map may also be a lazily-parsed simdjson document, in which case only the
+        block values are materialized into Python dicts. record_map and the blocks read from
+        it are typed as Any so a mypyc build does not reject the simdjson proxy objects.
         """
-        blocks = record_map.get("recordMap", {}).get("block", {})
+        blocks: Any = record_map.get("recordMap", {}).get("block", {})
         requests = []
+        block_data: Any
         for block_data in blocks.values():
-            value = block_data.get("value", {})
+            value: Any = block_data.get("value", {})
+            if not isinstance(value, dict):
+                value = value.as_dict()
             req = MarketingRequest.from_notion_page(value)
             requests.append(req)
-        requests.sort()
         return cls(requests)
 
-    def _fetch(self, val: str, key: callable):
+    def _sorted_requests(self) -> List[MarketingRequest]:
+        """
+        Return self.requests, sorting it the first time it is needed.
         """
-        Method to be wrapped by fetch_requests_by_status and fetch_requests_by_type.
+        if not self._requests_sorted:
+            self.requests = sorted(self.requests, key=lambda req: req._cached_sort_key)
+            self._requests_sorted = True
+        return self.requests
+
+    @staticmethod
+    def _sorted_bucket(index: Dict[Optional[str], List[MarketingRequest]], sorted_keys: Set[Optional[str]],
+                       key: Optional[str]) -> List[MarketingRequest]:
         """
-        return [req for req in self.requests if key(req) == val]
+        Return the bucket stored under key in index, sorting it the first time it is requested.
+        """
+        # Check sorted_keys before reading the bucket: a key is only added after its sorted
+        # bucket has been stored, so a reader that sees the key always gets the sorted list.
+        if key in sorted_keys:
+            return index[key]
+        bucket = index.get(key)
+        if bucket is None:
+            return []
+        bucket = sorted(bucket, key=lambda req: req._cached_sort_key)
+        index[key] = bucket
+        sorted_keys.add(key)
+        return bucket
 
     def fetch_requests_by_status(self, status: str) -> List[MarketingRequest]:
         """
         Return a list of MarketingRequest objects that match the given status.
         """
-        return self._fetch(status, lambda req: req.status)
-        
+        return list(self._sorted_bucket(self._by_status, self._sorted_status, status))
 
     def fetch_requests_by_type(self, content_type: str) -> List[MarketingRequest]:
         """
         Return a list of MarketingRequest objects that match the given content type.
         """
-        return self._fetch(content_type, lambda req: req.content_type)
+        return list(self._sorted_bucket(self._by_type, self._sorted_type, content_type))
 
-    def filter_by_criterion(self, *criteria: callable[[MarketingRequest], bool]) -> List[MarketingRequest]:
+    def filter_by_criterion(self, *criteria: Callable[[MarketingRequest], bool]) -> List[MarketingRequest]:
         """
         Return a list of MarketingRequest objects that satisfy all provided filter criteria.
         
         Each criterion is a callable that takes a MarketingRequest and returns a boolean.
+        Criteria are checked in order and stop at the first failure, so pass cheap ones first.
         For example, you might want to filter by:
           - status ("Completed"),
           - content_type ("Reel"), and
           - a post_date within this week.
         
         Usage:
-            filtered = collection.filter_requests(
+            filtered = collection.filter_by_criterion(
                 lambda req: req.status == "Completed",
                 lambda req: req.content_type == "Reel",
                 lambda req: is_this_week(req.post_date)
             )
         """
-        return [req for req in self.requests if all(criterion(req) for criterion in criteria)]
-
+        return [req for req in self._sorted_requests() if all(criterion(req) for criterion in criteria)]
 
+    def fetch_scheduled_this_week(self) -> List[MarketingRequest]:
+        """
+        Return the confirmed MarketingRequest objects that are to be posted this week.
+        Only the "Confirmed" bucket is scanned, and the is_this_week() check is inlined with
+        the current time read once for the whole bucket. Requests without a post date are skipped.
+        """
+        confirmed = self._sorted_bucket(self._by_status, self._sorted_status, "Confirmed")
+        now = datetime.now()
+        return [req for req in confirmed if req.post_date is not None and req.post_date <= now]
 
-    def __iter__(self):
-        return iter(self.requests)
+    def __iter__(self) -> Iterator[MarketingRequest]:
+        return iter(self._sorted_requests())
 
-    def __len__(self):
+    def __len__(self) -> int:
         return len(self.requests)
 
-    def __getitem__(self, index):
-        return self.requests[index]
+    def __getitem__(self, index: int) -> MarketingRequest:
+        return self._sorted_requests()[index]
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f"<MarketingRequestCollection with {len(self.requests)} requests>"
 
 
 # Example usage:
 if __name__ == "__main__":
     # Assume your exported Notion JSON is stored in 'marketing_requests.json'
-    with open("response.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open("response.json", "rb") as f:
+        data = orjson.loads(f.read())
 
     marketing_requests = MarketingRequestCollection.from_record_map(data)
 
-    marketing_requests.requests.sort()
     for req in marketing_requests:
         print(req)
@@ -1,4 +1,6 @@
+import orjson
 import requests
+import simdjson
 from MarketingAPI import MarketingRequestCollection, MarketingRequest
 
 
@@ -10,6 +12,12 @@ class NotionMarketingAPI:
     
     BASE_URL = "https://www.notion.so/api/v3/"
 
+    # Sort by 'nSLy' (status) then '{Rrz' (post date), both ascending.
+    DEFAULT_SORT_FIELDS = [
+        {"property": "nSLy", "direction": "ascending"},
+        {"property": "{Rrz", "direction": "ascending"},
+    ]
+
     def __init__(self, notion_api_key, collection_id, space_id, collection_view_id, user_id, user_timezone="America/Toronto"):
         """
         Initialize the API wrapper.
@@ -36,26 +44,17 @@ class NotionMarketingAPI:
         }
         self.params = {"src": "initial_load"}
 
-    def query_marketing_requests(self, limit=50, sort_fields=None, search_query=""):
-        """
-        Query the Notion collection to retrieve marketing requests.
+        # Persistent session so repeated queries reuse the same keep-alive connection.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
 
-        :param limit: Maximum number of records to fetch.
-        :param sort_fields: A list of dictionaries to define sort order.
-                            Each dictionary should contain 'property' and 'direction' keys.
-                            Defaults to sorting by 'nSLy' then '{Rrz', both ascending.
-        :param search_query: A search string to filter records.
-        :return: A sorted MarketingRequestCollection instance.
-        :raises: requests.HTTPError if the API call fails.
-        """
-        # Default sort fields if none provided.
-        if sort_fields is None:
-            sort_fields = [
-                {"property": "nSLy", "direction": "ascending"},
-                {"property": "{Rrz", "direction": "ascending"},
-            ]
+        # Reused across polls so simdjson can amortize its internal buffers.
+        # A parser only holds one live document at a time, hence one per instance.
+        self._parser = simdjson.Parser()
 
-        payload = {
+        # The queryCollection payload is static apart from the limit, sort and search query,
+        # which query_marketing_requests fills in before serializing it.
+        self._payload_template = {
             "source": {
                 "type": "collection",
                 "id": self.collection_id,
@@ -69,22 +68,45 @@ class NotionMarketingAPI:
                 "reducers": {
                     "collection_group_results": {
                         "type": "results",
-                        "limit": limit,
+                        "limit": None,
                     },
                 },
-                "sort": sort_fields,
-                "searchQuery": search_query,
+                "sort": None,
+                "searchQuery": None,
                 "userId": self.user_id,
                 "userTimeZone": self.user_timezone,
             },
         }
 
+    def query_marketing_requests(self, limit=50, sort_fields=None, search_query=""):
+        """
+        Query the Notion collection to retrieve marketing requests.
+
+        :param limit: Maximum number of records to fetch.
+        :param sort_fields: A list of dictionaries to define sort order.
+                            Each dictionary should contain 'property' and 'direction' keys.
+                            Defaults to sorting by 'nSLy' then '{Rrz', both ascending.
+        :param search_query: A search string to filter records.
+        :return: A sorted MarketingRequestCollection instance.
+        :raises: requests.HTTPError if the API call fails.
+        """
+        # Default sort fields if none provided.
+        if sort_fields is None:
+            sort_fields = self.DEFAULT_SORT_FIELDS
+
+        payload = self._payload_template
+        loader = payload["loader"]
+        loader["reducers"]["collection_group_results"]["limit"] = limit
+        loader["sort"] = sort_fields
+        loader["searchQuery"] = search_query
+
         url = self.BASE_URL + "queryCollection"
-        response = requests.post(url, headers=self.headers, params=self.params, json=payload)
+        # The session already sends Content-Type: application/json, so post the orjson bytes directly.
+        response = self._session.post(url, params=self.params, data=orjson.dumps(payload))
         response.raise_for_status()  # Raises an exception for HTTP errors.
-        data = response.json()
+        # Parse lazily; only the blocks read by from_record_map become Python objects.
+        doc = self._parser.parse(response.content)
 
         # Convert the API response into a MarketingRequestCollection instance.
-        marketing_requests = MarketingRequestCollection.from_record_map(data)
-        marketing_requests.requests.sort()  # Assuming that MarketingRequest has __lt__ implemented.
+        marketing_requests = MarketingRequestCollection.from_record_map(doc)
         return marketing_requests
\ No newline at end of file
@@ -16,38 +16,75 @@ app = Flask(__name__)
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
 SLACK_SIGNING_SECRET = os.getenv("SLACK_SIGNING_SECRET")
 
-# Global cache for Notion API data
-notion_data = None
-
-def fetch_notion_data():
-    """Fetch marketing requests from Notion and update the global cache."""
-    notion_api = NotionMarketingAPI(
-        os.getenv("NOTION_API_KEY"), 
-        os.getenv("COLLECTION_ID"), 
-        os.getenv("SPACE_ID"), 
-        os.getenv("COLLECTION_VIEW_ID"), 
-        os.getenv("USER_ID")
-    )
-    global notion_data
-    while True:
+# Cache for Notion API data. Stale data is served while get_notion_data() refreshes it in the background.
+NOTION_CACHE_TTL = 60  # Seconds before cached data is considered stale
+NOTION_CACHE_MAX_STALENESS = 2 * NOTION_CACHE_TTL  # Seconds after which a request must wait for a refresh
+_cache = {"data": None, "ts": 0.0, "refreshing": False}
+_cache_lock = threading.Lock()
+_refresh_lock = threading.Lock()  # notion_api is only used by one refresh at a time
+
+notion_api = NotionMarketingAPI(
+    os.getenv("NOTION_API_KEY"), 
+    os.getenv("COLLECTION_ID"), 
+    os.getenv("SPACE_ID"), 
+    os.getenv("COLLECTION_VIEW_ID"), 
+    os.getenv("USER_ID")
+)
+
+def _refresh_notion_data():
+    """Fetch marketing requests from Notion and update the cache. Returns the cached data afterwards."""
+    with _refresh_lock:
+        with _cache_lock:
+            if _cache["data"] is not None and time.monotonic() - _cache["ts"] <= NOTION_CACHE_TTL:
+                # Another caller refreshed the cache while we waited for the lock.
+                _cache["refreshing"] = False
+                return _cache["data"]
+
         try:
-            notion_data = notion_api.query_marketing_requests()
-            print("Updated Notion data: " + str(notion_data))
+            data = notion_api.query_marketing_requests()
+            print("Updated Notion data: " + str(data))
         except Exception as e:
+            # Keep serving the last good data if the refresh fails.
             print("Error fetching Notion data:", e)
-        
-        time.sleep(60)  # Wait 60 seconds before updating again
-
-# Start background thread
-notion_thread = threading.Thread(target=fetch_notion_data, daemon=True)
-notion_thread.start()
+            data = None
+
+        with _cache_lock:
+            if data is not None:
+                _cache["data"] = data
+                _cache["ts"] = time.monotonic()
+            _cache["refreshing"] = False
+            return _cache["data"]
+
+def get_notion_data():
+    """
+    Return the cached marketing requests. If they are older than NOTION_CACHE_TTL, a background
+    refresh is started and the stale data is returned right away. If they are older than
+    NOTION_CACHE_MAX_STALENESS, the request waits for a synchronous refresh instead; the old
+    data is only returned if that refresh fails because Notion is unreachable.
+    """
+    with _cache_lock:
+        data = _cache["data"]
+        age = time.monotonic() - _cache["ts"]
+        if data is not None and age > NOTION_CACHE_MAX_STALENESS:
+            data = None
+        elif data is not None and not _cache["refreshing"] and age > NOTION_CACHE_TTL:
+            _cache["refreshing"] = True
+            threading.Thread(target=_refresh_notion_data, daemon=True).start()
+
+    if data is None:
+        # Nothing cached, or it is too old to serve without refreshing, so this request has to
+        # wait for Notion. If the refresh fails, the last good data is still returned.
+        data = _refresh_notion_data()
+        if data is None:
+            raise RuntimeError("Notion data is unavailable")
+    return data
 
 @app.route("/getbacklog", methods=["POST"])
 def generate_weekly_backlog_graphics():
 
     # Use the cached Notion data
 
-    filtered_data = notion_data.fetch_requests_by_status("Not Started")
+    filtered_data = get_notion_data().fetch_requests_by_status("Not Started")
 
     msg = "\n".join([request.to_markdown() for request in filtered_data])
 
@@ -63,12 +100,7 @@ def generate_weekly_posting_schedule():
     # filter data based on:
     # Requests that are CONFIRMED and WILL BE POSTED this week
 
-    filtered_data = notion_data.filter_by_criterion(
-        lambda req: req.status == "Confirmed",
-        lambda req: req.is_this_week()
-    )
-
-    filtered_data.sort()
+    filtered_data = get_notion_data().fetch_scheduled_this_week()
 
     msg = f"Posting Schedule for The Week of {datetime.now().strftime('%Y-%m-%d')}:\n"
 
@@ -4,6 +4,9 @@ import os
 import dotenv
 dotenv.load_dotenv("tokens.env")
 
+# Shared session so consecutive webhook posts reuse the same connection to Slack.
+_slack_session = requests.Session()
+
 def send_slack_webhook_message(webhook_url, message, username="Notifier", icon_emoji=":robot_face:", markdown=True):
     """
     Sends a message to a Slack channel via an incoming webhook.
@@ -21,7 +24,7 @@ def send_slack_webhook_message(webhook_url, message, username="Notifier", icon_e
         "mrkdwn": markdown,
     }
     
-    response = requests.post(webhook_url, json=payload)
+    response = _slack_session.post(webhook_url, json=payload)
     if response.status_code != 200:
         raise Exception(
             f"Request to Slack returned an error {response.status_code}, the response is:\n{response.text}"
@@ -32,9 +35,7 @@ def generate_weekly_backlog_graphics(webhook_url: str):
     x = NotionMarketingAPI(os.getenv("NOTION_API_KEY"), os.getenv("COLLECTION_ID"), os.getenv("SPACE_ID"), os.getenv("COLLECTION_VIEW_ID"), os.getenv("USER_ID"))
 
     y = x.query_marketing_requests()
-    msg = ""
-    for req in y.fetch_requests_by_status("Not Started"):
-        msg += req.to_markdown() + "\n"
+    msg = "\n".join(req.to_markdown() for req in y.fetch_requests_by_status("Not Started"))
     
     send_slack_webhook_message(webhook_url, msg, username="Marketing Bot", icon_emoji=":chart_with_upwards_trend:", markdown=True)
 
@@ -44,14 +45,9 @@ def generate_posting_schedule(webhook_url: str):
 
     y = x.query_marketing_requests()
 
-    filtered = y.filter_by_criterion(
-        lambda req: req.status == "Confirmed",
-        lambda req: req.is_this_week()
-    )
-    filtered.sort()
+    filtered = y.fetch_scheduled_this_week()
     msg = f"Posting Schedule for The Week of {datetime.datetime.now().strftime('%Y-%m-%d')}:\n"
-    for req in filtered:
-        msg += req.to_markdown() + "\n"
+    msg += "\n".join(req.to_markdown() for req in filtered)
     
     send_slack_webhook_message(webhook_url, msg, username="Marketing Bot", icon_emoji=":chart_with_upwards_trend:", markdown=True)
 